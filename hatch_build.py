@@ -1,6 +1,7 @@
-import subprocess
-import sys
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from hatchling.builders.hooks.plugin.interface import (  # ty:ignore[unresolved-import]
@@ -8,33 +9,63 @@ from hatchling.builders.hooks.plugin.interface import (  # ty:ignore[unresolved-
 )
 
 
+def _run_build_script(script: Path) -> None:
+    """Import a build script by path and call its main() in-process.
+
+    Loading by file path avoids importing the proxyflare package (whose
+    runtime dependencies are not installed in the isolated build env) and
+    skips spawning a whole Python interpreter per script — only the
+    cargo/npx toolchains remain subprocesses.
+    """
+    spec = importlib.util.spec_from_file_location(script.stem, script)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Could not load build script {script}")
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    try:
+        module.main()
+    except SystemExit as e:
+        # The scripts report failure via sys.exit(1)
+        if e.code:
+            raise RuntimeError(f"{script.name} failed with exit code {e.code}") from e
+
+
 class CustomBuildHook(BuildHookInterface):
     def initialize(self, version: str, build_data: dict[str, Any]) -> None:
         print("Running CustomBuildHook to build workers...")  # noqa: T201
 
         project_root = Path.cwd()
-        script_rust = project_root / "src" / "proxyflare" / "scripts" / "build_rust.py"
-        script_ts = project_root / "src" / "proxyflare" / "scripts" / "build_ts.py"
+        scripts_dir = project_root / "src" / "proxyflare" / "scripts"
+        scripts = []
+        for script in (scripts_dir / "build_rust.py", scripts_dir / "build_ts.py"):
+            if not script.exists():
+                print(f"Warning: Build script not found at {script}. Skipping.")  # noqa: T201
+                continue
+            print(f"Queueing build: {script}")  # noqa: T201
+            scripts.append(script)
 
         try:
-            if not script_rust.exists():
-                print(f"Warning: Rust build script not found at {script_rust}. Skipping.")  # noqa: T201
-            else:
-                print(f"Executing: {sys.executable} {script_rust}")  # noqa: T201
-                subprocess.run(
-                    [sys.executable, str(script_rust)], check=True, cwd=str(project_root)
-                )  # noqa: S603
-
-            if not script_ts.exists():
-                print(f"Warning: TS build script not found at {script_ts}. Skipping.")  # noqa: T201
-            else:
-                print(f"Executing: {sys.executable} {script_ts}")  # noqa: T201
-                subprocess.run([sys.executable, str(script_ts)], check=True, cwd=str(project_root))  # noqa: S603
+            # The Rust and TS toolchains are independent, so run both builds
+            # concurrently — wall-clock is max(T_rust, T_ts), not the sum.
+            # Threads suffice: the heavy lifting happens in the cargo/npx
+            # subprocesses the scripts spawn, so the GIL is irrelevant.
+            with ThreadPoolExecutor(max_workers=len(scripts) or 1) as pool:
+                futures = [pool.submit(_run_build_script, script) for script in scripts]
+                # Wait for both before raising, so a failure in one build
+                # does not leave the other running unattended.
+                errors = []
+                for future in futures:
+                    try:
+                        future.result()
+                    except RuntimeError as e:
+                        errors.append(e)
+            if errors:
+                print(f"Error in build hook (compilation failed): {errors[0]}")  # noqa: T201
+                raise RuntimeError("Worker build failed") from errors[0]
 
             print("Build hook complete.")  # noqa: T201
-        except subprocess.CalledProcessError as e:
-            print(f"Error in build hook (compilation failed): {e}")  # noqa: T201
-            raise RuntimeError("Worker build failed") from e
+        except RuntimeError:
+            raise
         except Exception as e:
             print(f"Unexpected error in build hook: {e}")  # noqa: T201
             raise RuntimeError("Unexpected build hook error") from e
@@ -1,7 +1,11 @@
 """Proxyflare - Cloudflare Workers Proxy Management CLI."""
 
-from .client.manager import ProxyflareWorkersManager
-from .client.transport import AsyncProxyflareTransport, ProxyflareTransport
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client.manager import ProxyflareWorkersManager
+    from .client.transport import AsyncProxyflareTransport, ProxyflareTransport
 
 __all__ = [
     "AsyncProxyflareTransport",
@@ -11,3 +15,24 @@ __all__ = [
 ]
 
 __version__ = "0.1.2"
+
+# PEP 562 lazy loading: the client classes transitively pull in httpx and
+# pydantic, which `proxyflare --help` (and anything else that only needs the
+# package namespace) should not pay for at import time.
+_LAZY_IMPORTS = {
+    "ProxyflareWorkersManager": "proxyflare.client.manager",
+    "AsyncProxyflareTransport": "proxyflare.client.transport",
+    "ProxyflareTransport": "proxyflare.client.transport",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
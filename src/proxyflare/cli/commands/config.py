@@ -10,7 +10,7 @@ from proxyflare.cli.context import get_app_context
 from proxyflare.cli.exceptions import ConfigError
 from proxyflare.cli.utils import handle_validation_error
 from proxyflare.exceptions import SubdomainMissingError
-from proxyflare.models.config import Config
+from proxyflare.models.config import get_config
 
 config_app = typer.Typer(
     no_args_is_help=True, help="Manage Proxyflare configuration (show, verify)."
@@ -109,7 +109,7 @@ def verify() -> None:
 def show() -> None:
     """Display the current Proxyflare configuration."""
     try:
-        config = Config()  # type: ignore[call-arg]
+        config = get_config()
         console.print(config)
     except ValidationError as e:
         handle_validation_error(e)
@@ -1,23 +1,27 @@
 import asyncio
 import time
+from dataclasses import replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, cast
+from typing import TYPE_CHECKING, Annotated, TextIO
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from pydantic import TypeAdapter, ValidationError
 
 from proxyflare.cli.console import console, err_console
 from proxyflare.cli.context import get_app_context
 from proxyflare.cli.exceptions import ConfigError, WorkerError
-from proxyflare.constants import DEFAULT_DEPLOY_CONCURRENCY, WorkerType
+from proxyflare.constants import DEFAULT_DEPLOY_CONCURRENCY, DEPLOY_BATCH_SIZE, WorkerType
 from proxyflare.models.deployment import DeploymentConfig
-from proxyflare.models.worker_result import WorkerRecord, WorkerResultFile
+from proxyflare.models.worker_result import WORKER_RECORD_LIST, WorkerRecord
+from proxyflare.utils.limiter import AdaptiveLimiter
 
 if TYPE_CHECKING:
-    from rich.progress import TaskID
+    from rich.progress import Progress, TaskID
 
     from proxyflare.cli.context import AppContext
 
+_WORKER_TYPE_ADAPTER: TypeAdapter[WorkerType] = TypeAdapter(WorkerType)
+
 
 async def _deploy_workers_parallel(
     ctx: "AppContext",
@@ -25,11 +29,27 @@ async def _deploy_workers_parallel(
     worker_type: WorkerType,
     wasm_content: bytes | None,
     count: int,
-    progress: Progress,
+    progress: "Progress",
     task_id: "TaskID",
+    stream_path: Path,
 ) -> list[WorkerRecord]:
     """
-    Deploy multiple workers in parallel using asyncio.gather and a semaphore.
+    Deploy multiple workers in parallel using a bounded pool of worker tasks.
+
+    Instead of spawning one task per deployment, a fixed number of pool
+    workers drain a queue of pending worker names in mini-batches of up to
+    DEPLOY_BATCH_SIZE, shipping each batch through
+    WorkerService.deploy_workers_batch so connection setup is amortized
+    across the batch. In-flight deploys are gated by an AdaptiveLimiter
+    seeded with DEFAULT_DEPLOY_CONCURRENCY, so concurrency ramps up while
+    Cloudflare keeps answering cleanly and backs off when deploys start
+    failing.
+
+    Each record is streamed to `stream_path` as a JSON line the moment its
+    deployment finishes, so a crash mid-run still leaves usable partial
+    output. The caller owns `stream_path` — a sidecar next to the real
+    result file — and promotes it to a strict JSON array at the end, so an
+    existing result file is never touched by a run that fails outright.
 
     Args:
         ctx: Application context containing the Cloudflare service.
@@ -39,41 +59,127 @@ async def _deploy_workers_parallel(
         count: Number of workers to deploy.
         progress: Rich progress bar instance.
         task_id: Rich task ID for progress tracking.
+        stream_path: Sidecar path the records are streamed to as they arrive.
 
     Returns:
         A list of WorkerRecord objects for successful deployments.
     """
-    sem = asyncio.Semaphore(DEFAULT_DEPLOY_CONCURRENCY)
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for name in ctx.service.generate_worker_names(count):
+        queue.put_nowait(name)
 
-    async def _deploy_one() -> WorkerRecord | None:
-        name = ctx.service.generate_worker_name()
-        async with sem:
-            try:
-                config = DeploymentConfig(
-                    name=name,
-                    script_content=script_content,
-                    worker_type=worker_type,
-                    wasm_content=wasm_content,
-                )
-                url = await ctx.service.deploy_worker(config)
-                progress.advance(task_id)
-                return WorkerRecord(
-                    name=name,
-                    url=url,
-                    type=worker_type,
-                    created_at=time.time(),
-                )
-            except Exception as e:
-                # Log error but don't fail everything
-                err_console.print(
-                    f"[bold red]Error:[/bold red] Failed to create worker [bold]{name}[/bold]: {e}"
+    records: list[WorkerRecord] = []
+    limiter = AdaptiveLimiter(DEFAULT_DEPLOY_CONCURRENCY)
+
+    # Wall-clock anchor read once; per-record timestamps are derived from
+    # the cheaper (vDSO) monotonic clock and stay ordered within the batch.
+    start_wall = time.time()
+    start_mono = time.monotonic()
+
+    # Shared template: only the name differs between deployments, so the
+    # (potentially large) script and wasm payloads are referenced once.
+    base_config = DeploymentConfig(
+        name="",
+        script_content=script_content,
+        worker_type=worker_type,
+        wasm_content=wasm_content,
+    )
+
+    with stream_path.open("w", encoding="utf-8") as stream:
+        # Size the pool for the limiter's ceiling; the limiter decides how
+        # many of these tasks may actually hold an in-flight deploy.
+        pool = [
+            asyncio.create_task(
+                _run_pool_worker(
+                    ctx,
+                    queue,
+                    limiter,
+                    base_config,
+                    records,
+                    stream,
+                    progress,
+                    task_id,
+                    created_at_anchor=(start_wall, start_mono),
                 )
-                progress.advance(task_id)
-                return None
+            )
+            for _ in range(min(count, limiter.max_limit))
+        ]
+        await asyncio.gather(*pool)
+
+    return records
+
+
+async def _run_pool_worker(
+    ctx: "AppContext",
+    queue: asyncio.Queue[str],
+    limiter: AdaptiveLimiter,
+    base_config: DeploymentConfig,
+    records: list[WorkerRecord],
+    stream: TextIO,
+    progress: "Progress",
+    task_id: "TaskID",
+    created_at_anchor: tuple[float, float],
+) -> None:
+    """
+    Drain the name queue in mini-batches until it is empty.
+
+    A module-level coroutine taking explicit arguments rather than a
+    closure: every pool task shares one reference to the (potentially
+    multi-MB) template config instead of holding its own closure cells.
 
-    tasks = [_deploy_one() for _ in range(count)]
-    settled = await asyncio.gather(*tasks)
-    return [r for r in settled if r is not None]
+    Args:
+        ctx: Application context containing the Cloudflare service.
+        queue: Queue of pending worker names.
+        limiter: Adaptive limiter gating in-flight deployments.
+        base_config: Template config; only the name varies per worker.
+        records: Shared list successful records are appended to.
+        stream: Open result stream records are written to as JSON lines.
+        progress: Rich progress bar instance.
+        task_id: Rich task ID for progress tracking.
+        created_at_anchor: (wall-clock, monotonic) pair captured at batch
+            start; record timestamps are wall + monotonic delta.
+    """
+    start_wall, start_mono = created_at_anchor
+    while not queue.empty():
+        # Claim up to a mini-batch of slots; the grant shrinks with the
+        # limiter's window so batching never overcommits it.
+        granted = await limiter.acquire_batch(DEPLOY_BATCH_SIZE)
+        batch: list[str] = []
+        while len(batch) < granted:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if not batch:
+            await limiter.release_batch(granted, successes=0, failures=0)
+            return
+
+        configs = [replace(base_config, name=name) for name in batch]
+        failures = 0
+        try:
+            outcomes = await ctx.service.deploy_workers_batch(configs)
+            for name, outcome in zip(batch, outcomes, strict=True):
+                if isinstance(outcome, BaseException):
+                    failures += 1
+                    # Log error but don't fail everything
+                    err_console.print(
+                        f"[bold red]Error:[/bold red] "
+                        f"Failed to create worker [bold]{name}[/bold]: {outcome}"
+                    )
+                else:
+                    record = WorkerRecord(
+                        name=name,
+                        url=outcome,
+                        type=base_config.worker_type,
+                        created_at=start_wall + (time.monotonic() - start_mono),
+                    )
+                    records.append(record)
+                    stream.write(record.model_dump_json() + "\n")
+                    stream.flush()
+                progress.advance(task_id)
+                queue.task_done()
+        finally:
+            await limiter.release_batch(granted, successes=len(batch) - failures, failures=failures)
 
 
 async def _create_async(
@@ -93,18 +199,23 @@ async def _create_async(
         ConfigError: If configuration is invalid.
         WorkerError: If deployment fails.
     """
+    # Deferred so importing the CLI command table stays cheap; only an
+    # actual deploy needs the progress machinery.
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     async with get_app_context() as ctx:
         # Resolve worker type
         final_worker_type_str = worker_type or ctx.config.worker_type
 
-        # Validate worker type
-        if final_worker_type_str not in ["python", "rust", "js", "ts"]:
+        # Validate worker type — the adapter both checks membership in the
+        # Literal and narrows the type for the rest of the pipeline.
+        try:
+            final_worker_type = _WORKER_TYPE_ADAPTER.validate_python(final_worker_type_str)
+        except ValidationError as e:
             raise ConfigError(
                 f"Invalid worker type '{final_worker_type_str}'. "
                 "Must be 'python', 'rust', 'js', or 'ts'."
-            )
-
-        final_worker_type = cast(WorkerType, final_worker_type_str)
+            ) from e
 
         # Load Source
         try:
@@ -133,6 +244,9 @@ async def _create_async(
                 )
 
                 task_create = progress.add_task(f"Creating {count} workers...", total=count)
+                # Records stream to a sidecar so a pre-existing result file
+                # survives a run that produces nothing.
+                partial = result.with_suffix(".partial")
                 results_data = await _deploy_workers_parallel(
                     ctx,
                     script_content,
@@ -141,6 +255,7 @@ async def _create_async(
                     count,
                     progress,
                     task_create,
+                    partial,
                 )
 
             except RuntimeError as e:
@@ -150,19 +265,42 @@ async def _create_async(
                     "Could not complete deployment. Check your API token and account settings."
                 ) from e
 
-        # Save Results
+        # Save Results — rewrite the sidecar's JSON lines as the strict JSON
+        # array the result-file readers expect, then promote it over the
+        # real result path. On total failure only the sidecar is removed.
         if results_data:
-            result_file = WorkerResultFile(root=results_data)
-            result.write_text(result_file.model_dump_json(indent=2))
+            partial.write_bytes(WORKER_RECORD_LIST.dump_json(results_data, indent=2))
+            partial.replace(result)
 
             console.print(
                 f"\n[bold green]Successfully created {len(results_data)} workers![/bold green]"
             )
             console.print(f"Results saved to: [bold]{result}[/bold]")
         else:
+            partial.unlink(missing_ok=True)
             console.print("\n[yellow]No workers were created.[/yellow]")
 
 
+def _loop_factory() -> asyncio.AbstractEventLoop:
+    """Build an event loop with eager task execution (Python 3.12+).
+
+    Prefers uvloop (installed via the [perf] extra; Linux/macOS only) for
+    its faster socket handling on bulk network-bound deploys, falling back
+    to the stdlib loop. Eagerly started tasks skip the schedule/wakeup
+    round-trip when their coroutine can complete synchronously — e.g.
+    deploys resolved from the cached subdomain check — which trims asyncio
+    bookkeeping per task.
+    """
+    try:
+        import uvloop
+
+        loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
 def create(
     count: Annotated[int, typer.Option(help="Number of workers to create")] = 1,
     worker_type: Annotated[
@@ -174,4 +312,4 @@ def create(
     ),
 ) -> None:
     """Deploy new Cloudflare proxy workers."""
-    asyncio.run(_create_async(count, worker_type, result))
+    asyncio.run(_create_async(count, worker_type, result), loop_factory=_loop_factory)
@@ -4,13 +4,15 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 
+import httpx
 import typer
 from cloudflare import AsyncCloudflare
 from rich.console import Console
 
 from proxyflare.cli.console import console as _console
 from proxyflare.cli.console import err_console as _err_console
-from proxyflare.models.config import Config
+from proxyflare.constants import DEFAULT_API_TIMEOUT, DEFAULT_DEPLOY_CONCURRENCY
+from proxyflare.models.config import Config, get_config
 from proxyflare.services.worker import WorkerService
 
 __all__ = ["AppContext", "get_app_context"]
@@ -35,7 +37,7 @@ async def get_app_context() -> AsyncIterator[AppContext]:
     Raises typer.Exit(1) on configuration errors.
     """
     try:
-        config = Config()  # type: ignore[call-arg]
+        config = get_config()
     except Exception as e:
         _err_console.print(f"[bold red]Configuration error:[/bold red] {e}")
         _err_console.print(
@@ -44,8 +46,23 @@ async def get_app_context() -> AsyncIterator[AppContext]:
         )
         raise typer.Exit(1) from e
 
-    # robust client creation inside the async context
-    async with AsyncCloudflare(api_token=config.api_token.get_secret_value()) as client:
+    # One shared HTTP/2 client for every API call in this context: TLS is
+    # negotiated once and deploys multiplex over the keep-alive pool
+    # instead of paying a handshake per request. The pool is sized for the
+    # adaptive limiter's ceiling (4x the initial deploy concurrency).
+    async with (
+        httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=DEFAULT_DEPLOY_CONCURRENCY,
+                max_connections=DEFAULT_DEPLOY_CONCURRENCY * 4,
+            ),
+            timeout=DEFAULT_API_TIMEOUT,
+        ) as http_client,
+        AsyncCloudflare(
+            api_token=config.api_token.get_secret_value(), http_client=http_client
+        ) as client,
+    ):
         service = WorkerService(client, config.account_id, config.worker_prefix)
         yield AppContext(
             config=config,
@@ -1,7 +1,7 @@
 import secrets
 from pathlib import Path
 
-from proxyflare.models.worker_result import WorkerResultFile
+from proxyflare.models.worker_result import WORKER_RECORD_LIST
 
 __all__ = ["ProxyflareWorkersManager"]
 
@@ -34,15 +34,15 @@ class ProxyflareWorkersManager:
             raise ValueError("No workers found in the provided source.")
 
     def load_from_file(self, path: str | Path) -> None:
-        """Load workers from a JSON file validated by WorkerResultFile model."""
+        """Load workers from a JSON file validated against the WorkerRecord schema."""
         file_path = Path(path)
         if not file_path.exists():
             raise FileNotFoundError(f"Worker file not found: {file_path}")
 
         try:
             data = file_path.read_text(encoding="utf-8")
-            result_file = WorkerResultFile.model_validate_json(data)
-            self.workers = [record.url for record in result_file.root]
+            records = WORKER_RECORD_LIST.validate_json(data)
+            self.workers = [record.url for record in records]
         except Exception as e:
             raise ValueError(f"Failed to parse worker file: {e}") from e
 
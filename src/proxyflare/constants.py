@@ -1,16 +1,19 @@
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, get_args
 
 __all__ = [
     "COMPATIBILITY_DATE",
     "CONTENT_TYPES",
+    "DEFAULT_API_TIMEOUT",
     "DEFAULT_DEPLOY_CONCURRENCY",
     "DEFAULT_WORKER_TIMEOUT",
     "DEFAULT_WORKER_WAIT",
+    "DEPLOY_BATCH_SIZE",
     "WORKER_META",
     "WORKER_TYPES",
     "WorkerMeta",
     "WorkerType",
+    "worker_meta",
 ]
 
 # Cloudflare
@@ -18,10 +21,15 @@ COMPATIBILITY_DATE = "2024-04-01"
 
 # Worker Types
 WorkerType = Literal["python", "rust", "js", "ts"]
-WORKER_TYPES: set[WorkerType] = {"python", "rust", "js", "ts"}
+WORKER_TYPES: frozenset[WorkerType] = frozenset(get_args(WorkerType))
 
 # Defaults
 DEFAULT_DEPLOY_CONCURRENCY = 5
+DEPLOY_BATCH_SIZE = 8
+# Cloudflare API calls (matches the SDK's own default): script uploads can
+# push multi-MB payloads, so this is deliberately much larger than the
+# worker health-check timeout below.
+DEFAULT_API_TIMEOUT = 60.0
 DEFAULT_WORKER_TIMEOUT = 10.0
 DEFAULT_WORKER_WAIT = 2.0
 
@@ -36,27 +44,63 @@ class WorkerMeta:
     wasm_file: str | None = None
 
 
+_PYTHON_META = WorkerMeta(
+    main_module="worker.py",
+    source_file="worker.py",
+    compatibility_flags=("python_workers",),
+)
+_JS_META = WorkerMeta(
+    main_module="worker.js",
+    source_file="worker.js",
+)
+_RUST_META = WorkerMeta(
+    main_module="worker.js",
+    source_file="index.js",
+    wasm_file="index_bg.wasm",
+)
+_TS_META = WorkerMeta(
+    main_module="worker.js",
+    source_file="dist/worker.js",
+)
+
 WORKER_META: dict[WorkerType, WorkerMeta] = {
-    "python": WorkerMeta(
-        main_module="worker.py",
-        source_file="worker.py",
-        compatibility_flags=("python_workers",),
-    ),
-    "js": WorkerMeta(
-        main_module="worker.js",
-        source_file="worker.js",
-    ),
-    "rust": WorkerMeta(
-        main_module="worker.js",
-        source_file="index.js",
-        wasm_file="index_bg.wasm",
-    ),
-    "ts": WorkerMeta(
-        main_module="worker.js",
-        source_file="dist/worker.js",
-    ),
+    "python": _PYTHON_META,
+    "js": _JS_META,
+    "rust": _RUST_META,
+    "ts": _TS_META,
 }
 
+
+def worker_meta(worker_type: WorkerType) -> WorkerMeta:
+    """
+    Resolve deployment metadata for a worker type.
+
+    WorkerType is a closed Literal, so a match statement resolves to
+    identity/equality checks against interned strings — no dict hashing on
+    the per-deploy hot path.
+
+    Args:
+        worker_type: The type of worker.
+
+    Returns:
+        The WorkerMeta constant for that type.
+
+    Raises:
+        ValueError: If the worker type is unknown.
+    """
+    match worker_type:
+        case "python":
+            return _PYTHON_META
+        case "js":
+            return _JS_META
+        case "rust":
+            return _RUST_META
+        case "ts":
+            return _TS_META
+        case _:
+            raise ValueError(f"Unknown worker type: {worker_type}")
+
+
 CONTENT_TYPES: dict[str, str] = {
     "python": "text/x-python",
     "js": "application/javascript+module",
@@ -1,9 +1,10 @@
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-__all__ = ["Config"]
+__all__ = ["Config", "get_config"]
 
 
 class Config(BaseSettings):
@@ -31,3 +32,15 @@ class Config(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
     )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Return the process-wide Config instance.
+
+    Instantiating BaseSettings re-reads .env and scans the environment on
+    every call; the settings cannot change mid-process, so parse once and
+    reuse. Use `get_config.cache_clear()` in tests that mutate the env.
+    """
+    return Config()  # type: ignore[call-arg]
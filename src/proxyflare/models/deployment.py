@@ -1,14 +1,22 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 from proxyflare.constants import WorkerType
 
 __all__ = ["DeploymentConfig"]
 
 
-class DeploymentConfig(BaseModel):
-    """Configuration for deploying a worker."""
+@dataclass(frozen=True, slots=True)
+class DeploymentConfig:
+    """Configuration for deploying a worker.
+
+    A plain frozen dataclass rather than a Pydantic model: instances are
+    built internally (never parsed from untrusted input), and bulk deploys
+    stamp out one per worker from a shared template — skipping validation
+    avoids re-checking the same multi-MB script content N times.
+    """
 
     name: str
     script_content: str
     worker_type: WorkerType
     wasm_content: bytes | None = None
+    """WASM binary; one bytes object shared by reference across deploys."""
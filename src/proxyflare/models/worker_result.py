@@ -2,9 +2,9 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel, RootModel, TypeAdapter
 
-__all__ = ["WorkerRecord", "WorkerResultFile"]
+__all__ = ["WORKER_RECORD_LIST", "WorkerRecord", "WorkerResultFile"]
 
 
 class WorkerRecord(BaseModel):
@@ -31,3 +31,8 @@ class WorkerResultFile(RootModel[list[WorkerRecord]]):
     """Typed model for proxyflare-workers.json — a list of WorkerRecord entries."""
 
     pass
+
+
+WORKER_RECORD_LIST: TypeAdapter[list[WorkerRecord]] = TypeAdapter(list[WorkerRecord])
+"""Adapter for (de)serializing record lists directly through pydantic-core,
+without constructing a RootModel wrapper (and its validation pass) per call."""
@@ -4,11 +4,33 @@ Script to build TypeScript workers for Proxyflare.
 Wraps 'npx esbuild' to bundle the TS file.
 """
 
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 
+def _resolve_esbuild() -> list[str]:
+    """
+    Locate the esbuild binary, preferring the pinned devDependency.
+
+    esbuild is pinned in package.json; calling the installed binary from
+    node_modules/.bin directly skips the registry consultation 'npx -y'
+    performs on every invocation. Fall back to PATH, then to npx for
+    environments where node_modules was never installed.
+    """
+    repo_root = Path(__file__).parents[3]
+    local_bin = repo_root / "node_modules" / ".bin" / "esbuild"
+    if local_bin.exists():
+        return [str(local_bin)]
+
+    on_path = shutil.which("esbuild")
+    if on_path:
+        return [on_path]
+
+    return ["npx", "-y", "esbuild"]
+
+
 def main() -> None:
     ts_dir = Path(__file__).parent.parent / "workers" / "ts"
 
@@ -20,9 +42,7 @@ def main() -> None:
         print("Running tsc / build...")
         subprocess.run(
             [
-                "npx",
-                "-y",
-                "esbuild",
+                *_resolve_esbuild(),
                 "worker.ts",
                 "--bundle",
                 "--outfile=dist/worker.js",
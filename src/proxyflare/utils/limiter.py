@@ -0,0 +1,101 @@
+"""Adaptive concurrency limiter for Cloudflare API calls."""
+
+import asyncio
+
+__all__ = ["AdaptiveLimiter"]
+
+
+class AdaptiveLimiter:
+    """
+    AIMD (additive-increase / multiplicative-decrease) concurrency limiter.
+
+    Starts with `initial` concurrent slots and adapts to observed outcomes:
+    successes grow the window additively (roughly +1 per full window of
+    completions) up to `max_limit`, while a failure — a rate limit or server
+    error is treated as a congestion signal — halves it down to `min_limit`.
+    This lets bulk deploys ramp up under good conditions without hammering
+    the API when Cloudflare starts pushing back.
+    """
+
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: int | None = None) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting number of concurrent slots.
+            min_limit: Floor the window never shrinks below.
+            max_limit: Ceiling the window never grows above. Defaults to
+                four times `initial`.
+
+        Raises:
+            ValueError: If `initial` is smaller than `min_limit`.
+        """
+        if initial < min_limit:
+            raise ValueError(f"initial ({initial}) must be >= min_limit ({min_limit})")
+        self._limit = float(initial)
+        self._min_limit = min_limit
+        self._max_limit = max_limit if max_limit is not None else initial * 4
+        self._inflight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current size of the concurrency window."""
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """Ceiling the window can grow to."""
+        return self._max_limit
+
+    async def acquire(self) -> None:
+        """Wait until a slot is available within the current window."""
+        await self.acquire_batch(1)
+
+    async def release(self, *, success: bool) -> None:
+        """
+        Return a slot and adapt the window to the observed outcome.
+
+        Args:
+            success: Whether the guarded call completed without error.
+        """
+        await self.release_batch(1, successes=1 if success else 0, failures=0 if success else 1)
+
+    async def acquire_batch(self, want: int) -> int:
+        """
+        Wait until the window has room, then claim up to `want` slots.
+
+        The grant is clamped to the free space in the current window, so a
+        caller sizing its mini-batch to the return value never overcommits.
+
+        Args:
+            want: Maximum number of slots to claim.
+
+        Returns:
+            The number of slots actually granted (at least 1).
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._inflight < int(self._limit))
+            granted = min(want, int(self._limit) - self._inflight)
+            self._inflight += granted
+            return granted
+
+    async def release_batch(self, granted: int, *, successes: int, failures: int) -> None:
+        """
+        Return a batch of slots and adapt the window to its outcomes.
+
+        Slots granted beyond successes + failures (an under-filled batch)
+        are returned without influencing the window.
+
+        Args:
+            granted: Number of slots previously claimed via acquire_batch.
+            successes: How many guarded calls completed without error.
+            failures: How many guarded calls failed.
+        """
+        async with self._condition:
+            self._inflight -= granted
+            for _ in range(successes):
+                self._limit = min(self._limit + 1.0 / int(self._limit), self._max_limit)
+            if failures:
+                self._limit = max(self._limit / 2.0, float(self._min_limit))
+            self._condition.notify_all()
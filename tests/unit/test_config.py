@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from proxyflare.models.config import Config
+from proxyflare.models.config import Config, get_config
 
 
 def test_config_from_env(monkeypatch):
@@ -21,3 +21,20 @@ def test_config_missing_env(monkeypatch):
 
     with pytest.raises(ValidationError):
         Config(_env_file=None)  # type: ignore[call-arg]
+
+
+def test_get_config_is_cached(monkeypatch):
+    """get_config parses the environment once and reuses the instance."""
+    monkeypatch.setenv("PROXYFLARE_ACCOUNT_ID", "cached_account")
+    monkeypatch.setenv("PROXYFLARE_API_TOKEN", "cached_token")
+
+    get_config.cache_clear()
+    try:
+        first = get_config()
+        assert first.account_id == "cached_account"
+
+        # Later env changes are not observed by the cached instance
+        monkeypatch.setenv("PROXYFLARE_ACCOUNT_ID", "other_account")
+        assert get_config() is first
+    finally:
+        get_config.cache_clear()
@@ -102,10 +102,10 @@ def test_verify_command_missing_permissions(mock_ctx):
 
 def test_show_command():
     """Test the show command."""
-    with patch("proxyflare.cli.commands.config.Config") as MockConfig:
+    with patch("proxyflare.cli.commands.config.get_config") as mock_get_config:
         mock_config_instance = MagicMock()
         mock_config_instance.__str__.return_value = "Mock Config"
-        MockConfig.return_value = mock_config_instance
+        mock_get_config.return_value = mock_config_instance
 
         result = runner.invoke(config_app, ["show"])
 
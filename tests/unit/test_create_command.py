@@ -27,6 +27,19 @@ def mock_ctx(tmp_path):
     mock_service.list_workers = AsyncMock()
     mock_service.delete_worker = AsyncMock()
 
+    # Mirror the real batch API: delegate to the per-worker deploy mock so
+    # tests keep configuring deploy_worker directly.
+    async def _deploy_batch(configs):
+        outcomes = []
+        for config in configs:
+            try:
+                outcomes.append(await mock_service.deploy_worker(config))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    mock_service.deploy_workers_batch = AsyncMock(side_effect=_deploy_batch)
+
     mock_config = MagicMock()
     mock_config.api_token.get_secret_value.return_value = "test-token"
     mock_config.account_id = "test-account-id"
@@ -57,7 +70,7 @@ def test_create_single_worker(mock_ctx):
 
     ctx.service.get_worker_source.return_value = ("print('hello')", None)
     ctx.service.ensure_subdomain.return_value = "test-sub"
-    ctx.service.generate_worker_name.return_value = "proxyflare-123-abc"
+    ctx.service.generate_worker_names.return_value = ["proxyflare-123-abc"]
     ctx.service.deploy_worker.return_value = "https://proxyflare-123-abc.test-sub.workers.dev"
 
     result = runner.invoke(app, ["create", "--result", str(result_path)])
@@ -83,7 +96,7 @@ def test_create_multiple_workers(mock_ctx):
     ctx.service.ensure_subdomain.return_value = "test-sub"
 
     names = ["proxyflare-1-aaa", "proxyflare-2-bbb", "proxyflare-3-ccc"]
-    ctx.service.generate_worker_name.side_effect = names
+    ctx.service.generate_worker_names.return_value = names
     ctx.service.deploy_worker.side_effect = [f"https://{n}.test-sub.workers.dev" for n in names]
 
     result = runner.invoke(app, ["create", "--count", "3", "--result", str(result_path)])
@@ -144,7 +157,7 @@ def test_create_partial_deploy_failure(mock_ctx):
     ctx.service.ensure_subdomain.return_value = "test-sub"
 
     names = ["proxyflare-1-ok", "proxyflare-2-fail"]
-    ctx.service.generate_worker_name.side_effect = names
+    ctx.service.generate_worker_names.return_value = names
     ctx.service.deploy_worker.side_effect = [
         "https://proxyflare-1-ok.test-sub.workers.dev",
         RuntimeError("Deploy failed"),
@@ -158,13 +171,32 @@ def test_create_partial_deploy_failure(mock_ctx):
     assert data[0]["name"] == "proxyflare-1-ok"
 
 
+def test_create_total_failure_preserves_existing_results(mock_ctx):
+    """A run where every deploy fails must leave a previous result file intact."""
+    ctx, tmp_path = mock_ctx
+    result_path = tmp_path / "result.json"
+    result_path.write_text('[{"name": "previous-run"}]')
+
+    ctx.service.get_worker_source.return_value = ("print('hello')", None)
+    ctx.service.ensure_subdomain.return_value = "test-sub"
+    ctx.service.generate_worker_names.return_value = ["proxyflare-1-fail"]
+    ctx.service.deploy_worker.side_effect = RuntimeError("Deploy failed")
+
+    result = runner.invoke(app, ["create", "--result", str(result_path)])
+
+    assert result.exit_code == 0
+    assert "No workers were created" in result.stdout
+    assert json.loads(result_path.read_text()) == [{"name": "previous-run"}]
+    assert not result_path.with_suffix(".partial").exists()
+
+
 def test_create_with_explicit_type(mock_ctx):
     ctx, tmp_path = mock_ctx
     result_path = tmp_path / "result.json"
 
     ctx.service.get_worker_source.return_value = ("addEventListener('fetch'..)", None)
     ctx.service.ensure_subdomain.return_value = "test-sub"
-    ctx.service.generate_worker_name.return_value = "proxyflare-js-abc"
+    ctx.service.generate_worker_names.return_value = ["proxyflare-js-abc"]
     ctx.service.deploy_worker.return_value = "https://proxyflare-js-abc.test-sub.workers.dev"
 
     result = runner.invoke(app, ["create", "--type", "js", "--result", str(result_path)])
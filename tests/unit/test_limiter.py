@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from proxyflare.utils.limiter import AdaptiveLimiter
+
+# --- construction ---
+
+
+def test_initial_limit():
+    limiter = AdaptiveLimiter(5)
+    assert limiter.limit == 5
+
+
+def test_default_max_limit_is_four_times_initial():
+    limiter = AdaptiveLimiter(5)
+    assert limiter.max_limit == 20
+
+
+def test_initial_below_min_rejected():
+    with pytest.raises(ValueError, match="must be >= min_limit"):
+        AdaptiveLimiter(1, min_limit=2)
+
+
+# --- adaptation ---
+
+
+async def test_success_grows_window_additively():
+    limiter = AdaptiveLimiter(2, max_limit=10)
+
+    # Two successes at limit=2 add 1/2 each — one full window grows by ~1.
+    for _ in range(2):
+        await limiter.acquire()
+        await limiter.release(success=True)
+
+    assert limiter.limit == 3
+
+
+async def test_failure_halves_window():
+    limiter = AdaptiveLimiter(8)
+    await limiter.acquire()
+    await limiter.release(success=False)
+    assert limiter.limit == 4
+
+
+async def test_window_respects_max_limit():
+    limiter = AdaptiveLimiter(2, max_limit=3)
+    for _ in range(20):
+        await limiter.acquire()
+        await limiter.release(success=True)
+    assert limiter.limit == 3
+
+
+async def test_window_respects_min_limit():
+    limiter = AdaptiveLimiter(4, min_limit=2)
+    for _ in range(5):
+        await limiter.acquire()
+        await limiter.release(success=False)
+    assert limiter.limit == 2
+
+
+# --- gating ---
+
+
+async def test_acquire_batch_clamped_to_free_window():
+    limiter = AdaptiveLimiter(3)
+    granted = await limiter.acquire_batch(8)
+    assert granted == 3
+    await limiter.release_batch(granted, successes=granted, failures=0)
+
+
+async def test_release_batch_surplus_slots_do_not_adapt():
+    limiter = AdaptiveLimiter(4)
+    granted = await limiter.acquire_batch(4)
+    # Only two slots were actually used; the surplus must not grow the window.
+    await limiter.release_batch(granted, successes=2, failures=0)
+    assert limiter.limit == 4  # 2 × 1/4 growth rounds down to the same window
+
+
+async def test_release_batch_failure_halves_window():
+    limiter = AdaptiveLimiter(8)
+    granted = await limiter.acquire_batch(8)
+    await limiter.release_batch(granted, successes=7, failures=1)
+    assert limiter.limit < 8
+
+
+async def test_acquire_blocks_when_window_full():
+    limiter = AdaptiveLimiter(1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await limiter.release(success=True)
+    await asyncio.wait_for(waiter, timeout=1)
@@ -69,6 +69,28 @@ def test_generate_worker_name_custom_prefix(mock_client):
     assert name.startswith("myprefix-")
 
 
+# --- generate_worker_names ---
+
+
+def test_generate_worker_names_count_and_prefix(service):
+    names = service.generate_worker_names(10)
+    assert len(names) == 10
+    assert all(name.startswith("proxyflare-") for name in names)
+
+
+def test_generate_worker_names_unique(service):
+    names = service.generate_worker_names(50)
+    assert len(set(names)) == 50
+
+
+def test_generate_worker_names_retries_collisions(service, monkeypatch):
+    """Duplicate candidates are discarded until the batch is unique."""
+    candidates = iter(["proxyflare-1-aaa", "proxyflare-1-aaa", "proxyflare-1-bbb"])
+    monkeypatch.setattr(service, "generate_worker_name", lambda: next(candidates))
+
+    assert service.generate_worker_names(2) == ["proxyflare-1-aaa", "proxyflare-1-bbb"]
+
+
 # --- deploy_worker ---
 
 
@@ -138,6 +160,27 @@ async def test_deploy_worker_failure(service, mock_client):
         await service.deploy_worker(config)
 
 
+# --- deploy_workers_batch ---
+
+
+async def test_deploy_workers_batch_outcomes_aligned(service):
+    """Batch returns URL or exception per config, in order."""
+    error = RuntimeError("boom")
+    service.deploy_worker = AsyncMock(side_effect=["https://a.workers.dev", error])
+
+    configs = [
+        DeploymentConfig(name=name, script_content="x", worker_type="python")
+        for name in ("worker-a", "worker-b")
+    ]
+    outcomes = await service.deploy_workers_batch(configs)
+
+    assert outcomes == ["https://a.workers.dev", error]
+
+
+async def test_deploy_workers_batch_empty(service):
+    assert await service.deploy_workers_batch([]) == []
+
+
 # --- list_workers ---
 
 
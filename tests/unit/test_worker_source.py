@@ -61,6 +61,20 @@ def test_get_worker_source_rust_resources(service):
         MockResources.files.assert_called_with("proxyflare.workers.rust.build")
 
 
+def test_get_worker_source_rust_real_wasm_file(service, tmp_path):
+    """WASM resolving to a real file is returned as plain bytes."""
+    (tmp_path / "index.js").write_bytes(b"rust_shim")
+    (tmp_path / "index_bg.wasm").write_bytes(b"rust_wasm_bytes")
+
+    with patch("proxyflare.services.worker.resources") as MockResources:
+        MockResources.files.return_value = tmp_path
+
+        content, wasm = service.get_worker_source("rust")
+
+    assert content == "rust_shim"
+    assert wasm == b"rust_wasm_bytes"
+
+
 def test_get_worker_source_not_found(service):
     """Test that it raises FileNotFoundError if resources are missing."""
     with patch("proxyflare.services.worker.resources") as MockResources: